@@ -0,0 +1,92 @@
+"""
+benchmarks.bench_adaptive_batch
+
+Débit de l'import (documents / s) avec des batchs de taille fixe et avec
+la taille adaptative (libs.mongoDb.batching).
+
+Sans --mongo-uri, la collection est simulée : un insert_many dure
+`--overhead` secondes (aller-retour, validation) plus le temps d'écriture
+de ses octets BSON à `--bandwidth` Mo/s, qui se dégrade au-delà de
+`--cache-mb` Mo par batch (pression sur le cache du serveur). Sans
+consommer de CPU.
+
+    python -m benchmarks.bench_adaptive_batch --rows 400000
+    python -m benchmarks.bench_adaptive_batch --rows 1000000 --mongo-uri mongodb://localhost:27017
+
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from pymongo import MongoClient
+
+from benchmarks.utils import timer
+from libs.mongoDb.batching import documents_bytes
+from libs.mongoDb.migrate_to_mongodb import migrate_dataframe_to_collection
+from libs.normalisers import normalize_dataframe
+from tests.factories import make_healthcare_df
+
+BENCH_DB = "bench_adaptive_batch"
+
+
+class CostModelCollection:
+    """ Collection simulée : durée d'un insert_many selon sa taille BSON. """
+
+    def __init__(self, overhead: float, bandwidth: float, cache_bytes: float):
+        self.overhead = overhead
+        self.bandwidth = bandwidth
+        self.cache_bytes = cache_bytes
+        self.count = 0
+
+    def insert_many(self, docs, ordered=True):
+        n_bytes = documents_bytes(docs)
+        slowdown = 1 + max(n_bytes - self.cache_bytes, 0) / self.cache_bytes
+        time.sleep(self.overhead + n_bytes / self.bandwidth * slowdown)
+        self.count += len(docs)
+
+        class Result:
+            inserted_ids = [doc["_id"] for doc in docs]
+        return Result()
+
+    def count_documents(self, query):
+        return self.count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark taille des batchs")
+    parser.add_argument("--rows", type=int, default=400_000)
+    parser.add_argument("--overhead", type=float, default=0.03)
+    parser.add_argument("--bandwidth", type=float, default=100, help="Mo/s")
+    parser.add_argument("--cache-mb", type=float, default=8)
+    parser.add_argument("--mongo-uri")
+    args = parser.parse_args()
+
+    df = normalize_dataframe(make_healthcare_df(args.rows))
+    target = args.mongo_uri or (f"collection simulée ({args.overhead * 1000:.0f} ms + {args.bandwidth:.0f} Mo/s, "
+                                f"ralentie au-delà de {args.cache_mb:.0f} Mo)")
+    print(f"\n* Benchmark taille des batchs : {len(df)} lignes, {target} *\n")
+
+    client = MongoClient(args.mongo_uri) if args.mongo_uri else None
+    results = {}
+    for batch_size in (1_000, 5_000, 20_000, 100_000, None):
+        if client is not None:
+            client[BENCH_DB].drop_collection("hospitalizations")
+            collection = client[BENCH_DB]["hospitalizations"]
+        else:
+            collection = CostModelCollection(args.overhead, args.bandwidth * 1e6, args.cache_mb * 1e6)
+        label = f"batchs de {batch_size} lignes" if batch_size else "taille adaptative"
+        output = io.StringIO()
+        with timer(label, results), contextlib.redirect_stdout(output):
+            stats = migrate_dataframe_to_collection(df, collection, batch_size=batch_size)
+        print(f"     {len(df) / results[label]:,.0f} docs/s, {stats['batches']} batchs, erreur : {stats['had_error']}")
+        if batch_size is None:
+            sizes = [line.split("(batch de ")[1].split(" lignes")[0]
+                     for line in output.getvalue().splitlines() if "(batch de " in line]
+            print(f"     tailles : {' '.join(sizes[:12])}{' ...' if len(sizes) > 12 else ''}")
+    if client is not None:
+        client.drop_database(BENCH_DB)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+benchmarks.bench_async_insert
+
+Débit de la migration (documents / s) : en série, insertions sur des
+threads (--insert-workers) et insertions asyncio (--async).
+
+Sans --mongo-uri, les collections sont simulées : chaque insert_many dure
+`--latency` secondes (aller-retour réseau et écriture côté serveur),
+sans consommer de CPU ; time.sleep pour la collection synchrone,
+asyncio.sleep pour la collection asynchrone.
+
+    python -m benchmarks.bench_async_insert --rows 200000 --latency 0.05
+    python -m benchmarks.bench_async_insert --rows 1000000 --mongo-uri mongodb://localhost:27017
+
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+
+from pymongo import AsyncMongoClient, MongoClient
+
+from benchmarks.bench_insert_workers import LatencyCollection
+from benchmarks.utils import timer
+from libs.mongoDb.migrate_to_mongodb import migrate_chunks_to_collection, migrate_chunks_to_collection_async
+from libs.normalisers import normalize_dataframe
+from tests.factories import make_healthcare_df
+
+BATCH_SIZE = 10_000
+BENCH_DB = "bench_async_insert"
+
+
+class AsyncLatencyCollection:
+    """ Collection asynchrone simulée : insert_many attend `latency` secondes. """
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.count = 0
+
+    async def insert_many(self, docs, ordered=True):
+        await asyncio.sleep(self.latency)
+        self.count += len(docs)
+
+        class Result:
+            inserted_ids = [doc["_id"] for doc in docs]
+        return Result()
+
+    async def count_documents(self, query):
+        return self.count
+
+
+async def migrate_async(df, args, workers: int) -> dict:
+    if args.mongo_uri is None:
+        collection = AsyncLatencyCollection(args.latency)
+        return await migrate_chunks_to_collection_async([df], collection, batch_size=BATCH_SIZE,
+                                                        insert_workers=workers)
+    client = AsyncMongoClient(args.mongo_uri)
+    try:
+        await client[BENCH_DB].drop_collection("hospitalizations")
+        collection = client[BENCH_DB]["hospitalizations"]
+        return await migrate_chunks_to_collection_async([df], collection, batch_size=BATCH_SIZE,
+                                                        insert_workers=workers)
+    finally:
+        await client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark insertions asyncio")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--mongo-uri")
+    args = parser.parse_args()
+
+    df = normalize_dataframe(make_healthcare_df(args.rows))
+    target = args.mongo_uri or f"collection simulée, {args.latency * 1000:.0f} ms par insert_many"
+    print(f"\n* Benchmark insertions : {len(df)} lignes, batchs de {BATCH_SIZE}, {target} *\n")
+
+    client = MongoClient(args.mongo_uri) if args.mongo_uri else None
+
+    def collection():
+        if client is None:
+            return LatencyCollection(args.latency)
+        client[BENCH_DB].drop_collection("hospitalizations")
+        return client[BENCH_DB]["hospitalizations"]
+
+    results = {}
+    runs = [
+        ("en série", lambda: migrate_chunks_to_collection([df], collection(), batch_size=BATCH_SIZE)),
+        (f"{args.workers} threads", lambda: migrate_chunks_to_collection(
+            [df], collection(), batch_size=BATCH_SIZE, insert_workers=args.workers)),
+        (f"asyncio, {args.workers} en cours", lambda: asyncio.run(migrate_async(df, args, args.workers))),
+    ]
+    for label, run in runs:
+        with timer(label, results), contextlib.redirect_stdout(io.StringIO()):
+            stats = run()
+        print(f"     {len(df) / results[label]:,.0f} docs/s, erreur : {stats['had_error']}")
+    if client is not None:
+        client.drop_database(BENCH_DB)
+
+
+if __name__ == "__main__":
+    main()
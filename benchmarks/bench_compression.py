@@ -0,0 +1,66 @@
+"""
+benchmarks.bench_compression
+
+Débit de lecture d'un CSV compressé (gzip, zstd, xz, bz2) comparé au CSV
+non compressé, en lecture complète (read_csv_typed) et par morceaux
+(iter_csv_chunks). Le débit est exprimé en Mo de CSV décompressé par seconde.
+
+    python -m benchmarks.bench_compression --rows 1000000
+
+"""
+import argparse
+import importlib.util
+import os
+import time
+
+import pandas as pd
+
+from benchmarks.utils import healthcare_csv
+from libs.utils import read_csv_typed, iter_csv_chunks
+
+_FORMATS = {"gzip": ".gz", "zstd": ".zst", "xz": ".xz", "bz2": ".bz2"}
+
+
+def compressed_copy(csv_path: str, compression: str) -> str:
+    """ Copie compressée du CSV, générée si elle n'existe pas encore. """
+    path = csv_path + _FORMATS[compression]
+    if not os.path.exists(path):
+        pd.read_csv(csv_path, dtype=str).to_csv(path, index=False, compression=compression)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lecture CSV compressé")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    csv_path = healthcare_csv(args.rows)
+    raw_mb = os.path.getsize(csv_path) / 1_000_000
+
+    sources = {"aucune": csv_path}
+    for compression in _FORMATS:
+        if compression == "zstd" and importlib.util.find_spec("zstandard") is None:
+            print(">> [INFO] zstandard non installé, format zstd ignoré.")
+            continue
+        sources[compression] = compressed_copy(csv_path, compression)
+
+    print(f"\n* Benchmark lecture CSV compressé ({raw_mb:.1f} Mo décompressés) *\n")
+    print(f"  {'compression': <12} {'taille Mo': >10} {'complet Mo/s': >13} {'morceaux Mo/s': >14}")
+    for compression, path in sources.items():
+        size_mb = os.path.getsize(path) / 1_000_000
+
+        start = time.perf_counter()
+        read_csv_typed(path)
+        full = raw_mb / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in iter_csv_chunks(path, args.chunk_size):
+            pass
+        chunked = raw_mb / (time.perf_counter() - start)
+
+        print(f"  {compression: <12} {size_mb: >10.1f} {full: >13.1f} {chunked: >14.1f}")
+
+
+if __name__ == "__main__":
+    main()
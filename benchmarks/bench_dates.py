@@ -0,0 +1,58 @@
+"""
+benchmarks.bench_dates
+
+Compare, sur les colonnes de dates, pd.to_datetime(errors="coerce") sans
+format (ancienne normalisation) et parse_dates (format détecté, une
+conversion par valeur distincte), sur les valeurs telles que lues par
+read_csv_typed (datetime.date avec le moteur pyarrow) et sur des chaînes
+aux formats ISO et jour/mois/année.
+
+    python -m benchmarks.bench_dates --rows 1000000
+
+"""
+import argparse
+
+import pandas as pd
+
+from benchmarks.utils import healthcare_csv, timer
+from libs.dates import parse_dates, detect_date_format
+from libs.utils import read_csv_typed
+
+from settings.constants import DATE_COLS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark conversion des dates")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = read_csv_typed(healthcare_csv(args.rows))
+    print(f"\n* Benchmark conversion des dates : {len(df)} lignes *\n")
+
+    for col in DATE_COLS:
+        dates = pd.to_datetime(df[col])
+        variants = {
+            "lues": df[col],
+            "ISO": dates.dt.strftime("%Y-%m-%d").astype(object),
+            "jour/mois/année": dates.dt.strftime("%d/%m/%Y").astype(object),
+        }
+        for label, serie in variants.items():
+            bench_serie(f"{col} ({label})", serie)
+
+
+def bench_serie(label: str, serie: pd.Series):
+    print(f"  {label} : {serie.nunique()} valeurs distinctes, "
+          f"format détecté {detect_date_format(serie.dropna().unique())}")
+    results = {}
+    with timer("pd.to_datetime(errors='coerce')", results):
+        expected = pd.to_datetime(serie, errors="coerce")
+    with timer("parse_dates", results):
+        parsed, coerced = parse_dates(serie)
+
+    gain = results["pd.to_datetime(errors='coerce')"] / results["parse_dates"]
+    print(f"  >> gain {gain:.1f}x, identique : {parsed.equals(expected)}, "
+          f"NaT : {int(expected.isna().sum())} (to_datetime) / {coerced} (parse_dates)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+benchmarks.bench_deferred_indexes
+
+Durée totale de l'import (insertions + index) selon l'ordre : index créés
+avant l'import (mis à jour à chaque insertion) ou après
+(import --deferred-indexes, une seule commande createIndexes).
+
+Sans --mongo-uri, la collection est simulée, sans consommer de CPU :
+ - un insert_many dure `--overhead` secondes plus l'écriture des octets
+   BSON à `--bandwidth` Mo/s, plus `--index-insert-us` microsecondes par
+   document et par index existant (insertion dans un B-tree) ;
+ - createIndexes sur la collection chargée dure `--scan-us` microsecondes
+   par document (un parcours, commun aux index construits ensemble) plus
+   `--build-us` microsecondes par document et par index (tri, puis
+   construction du B-tree).
+
+    python -m benchmarks.bench_deferred_indexes --rows 400000
+    python -m benchmarks.bench_deferred_indexes --rows 1000000 --mongo-uri mongodb://localhost:27017
+
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from pymongo import MongoClient
+
+from benchmarks.utils import timer
+from libs.mongoDb.batching import documents_bytes
+from libs.mongoDb.create_indexes import create_mongodb__indexes
+from libs.mongoDb.migrate_to_mongodb import migrate_dataframe_to_collection
+from libs.normalisers import normalize_dataframe
+from tests.factories import make_healthcare_df
+
+BATCH_SIZE = 10_000
+BENCH_DB = "bench_deferred_indexes"
+
+
+class IndexCostCollection:
+    """ Collection simulée : coût des index selon le moment de leur création. """
+
+    def __init__(self, args):
+        self.overhead = args.overhead
+        self.bandwidth = args.bandwidth * 1e6
+        self.index_insert = args.index_insert_us / 1e6
+        self.scan = args.scan_us / 1e6
+        self.build = args.build_us / 1e6
+        self.n_indexes = 0
+        self.count = 0
+
+    def insert_many(self, docs, ordered=True):
+        time.sleep(self.overhead + documents_bytes(docs) / self.bandwidth
+                   + len(docs) * self.n_indexes * self.index_insert)
+        self.count += len(docs)
+
+        class Result:
+            inserted_ids = [doc["_id"] for doc in docs]
+        return Result()
+
+    def create_indexes(self, indexes):
+        time.sleep(self.count * (self.scan + len(indexes) * self.build))
+        self.n_indexes += len(indexes)
+        return [index.document["name"] for index in indexes]
+
+    def count_documents(self, query):
+        return self.count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark index avant / après l'import")
+    parser.add_argument("--rows", type=int, default=400_000)
+    parser.add_argument("--overhead", type=float, default=0.03)
+    parser.add_argument("--bandwidth", type=float, default=100, help="Mo/s")
+    parser.add_argument("--index-insert-us", type=float, default=4)
+    parser.add_argument("--scan-us", type=float, default=1)
+    parser.add_argument("--build-us", type=float, default=1)
+    parser.add_argument("--mongo-uri")
+    args = parser.parse_args()
+
+    df = normalize_dataframe(make_healthcare_df(args.rows))
+    target = args.mongo_uri or (f"collection simulée ({args.index_insert_us:.0f} µs par index à l'insertion, "
+                                f"{args.scan_us:.0f} + {args.build_us:.0f} µs par index à la construction)")
+    print(f"\n* Benchmark index : {len(df)} lignes, batchs de {BATCH_SIZE}, {target} *\n")
+
+    client = MongoClient(args.mongo_uri) if args.mongo_uri else None
+
+    def collection():
+        if client is None:
+            return IndexCostCollection(args)
+        client[BENCH_DB].drop_collection("hospitalizations")
+        return client[BENCH_DB]["hospitalizations"]
+
+    def import_before(target):
+        create_mongodb__indexes(target)
+        return migrate_dataframe_to_collection(df, target, batch_size=BATCH_SIZE)
+
+    def import_deferred(target):
+        stats = migrate_dataframe_to_collection(df, target, batch_size=BATCH_SIZE)
+        create_mongodb__indexes(target)
+        return stats
+
+    results = {}
+    for label, run in [("index avant l'import", import_before), ("index après l'import", import_deferred)]:
+        target = collection()
+        with timer(label, results), contextlib.redirect_stdout(io.StringIO()):
+            stats = run(target)
+        print(f"     {len(df) / results[label]:,.0f} docs/s, erreur : {stats['had_error']}")
+    if client is not None:
+        client.drop_database(BENCH_DB)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+benchmarks.bench_distinct
+
+Compare le comptage des valeurs distinctes des colonnes à forte
+cardinalité (Name, Doctor, Hospital) par ensemble de chaînes nettoyées
+(implémentation d'origine) et par DistinctCounter (exact puis
+HyperLogLog), morceau par morceau comme en mode --stream : temps, pic
+mémoire et erreur de l'estimation.
+
+    python -m benchmarks.bench_distinct --rows 1000000
+
+"""
+import argparse
+import tracemalloc
+
+from benchmarks.utils import healthcare_csv, timer
+from libs.normalisers import normalize_dataframe
+from libs.sketches import DistinctCounter
+from libs.utils import iter_csv_chunks
+
+from settings.constants import CHUNK_SIZE
+
+COLS = ["Name", "Doctor", "Hospital"]
+
+
+def count_with_sets(chunks) -> dict[str, int]:
+    """ Implémentation d'origine. """
+    uniques = {col: set() for col in COLS}
+    for chunk in chunks:
+        for col in COLS:
+            uniques[col].update(chunk[col].dropna().map(str).map(str.strip))
+    return {col: len(values) for col, values in uniques.items()}
+
+
+def count_with_counters(chunks) -> dict[str, int]:
+    counters = {col: DistinctCounter() for col in COLS}
+    for chunk in chunks:
+        for col in COLS:
+            counters[col].update(chunk[col])
+    return {col: counter.count() for col, counter in counters.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark comptage des valeurs distinctes")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    csv_path = healthcare_csv(args.rows)
+    chunks = [normalize_dataframe(chunk) for chunk in iter_csv_chunks(csv_path, CHUNK_SIZE)]
+    print(f"\n* Benchmark valeurs distinctes : {args.rows} lignes, colonnes {COLS} *\n")
+
+    results = {}
+    for label, count in (("ensembles de chaînes", count_with_sets), ("DistinctCounter", count_with_counters)):
+        with timer(label, results):
+            results[f"{label} comptes"] = count(chunks)
+        # Pic mémoire mesuré à part (tracemalloc ralentit l'exécution)
+        tracemalloc.start()
+        count(chunks)
+        print(f"     pic mémoire {tracemalloc.get_traced_memory()[1] / 1e6:.1f} Mo")
+        tracemalloc.stop()
+
+    exact, approx = results["ensembles de chaînes comptes"], results["DistinctCounter comptes"]
+    print(f"\n  >> gain {results['ensembles de chaînes'] / results['DistinctCounter']:.1f}x")
+    for col in COLS:
+        print(f"  >> {col} : exact {exact[col]}, estimé {approx[col]} "
+              f"({(approx[col] - exact[col]) / exact[col] * 100:+.2f} %)")
+
+
+if __name__ == "__main__":
+    main()
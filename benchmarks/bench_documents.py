@@ -0,0 +1,56 @@
+"""
+benchmarks.bench_documents
+
+Compare la construction des documents MongoDB ligne par ligne (iterrows +
+row_to_document, implémentation d'origine) et par colonnes
+(dataframe_to_documents), par batch de BATCH_SIZE lignes, en documents
+par seconde.
+
+    python -m benchmarks.bench_documents --rows 200000
+
+"""
+import argparse
+
+from benchmarks.utils import timer
+from libs.normalisers import normalize_dataframe
+from libs.row_to_json import dataframe_to_documents, row_to_document
+from tests.factories import make_healthcare_df
+
+from settings.constants import BATCH_SIZE
+
+
+def iterrows_documents(df) -> int:
+    """ Implémentation d'origine. """
+    count = 0
+    for start in range(0, len(df), BATCH_SIZE):
+        count += len([row_to_document(row) for _, row in df.iloc[start:start + BATCH_SIZE].iterrows()])
+    return count
+
+
+def columnar_documents(df) -> int:
+    count = 0
+    for start in range(0, len(df), BATCH_SIZE):
+        count += len(dataframe_to_documents(df.iloc[start:start + BATCH_SIZE]))
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark construction des documents")
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    df = normalize_dataframe(make_healthcare_df(args.rows))
+    print(f"\n* Benchmark documents : {len(df)} lignes, batchs de {BATCH_SIZE} *\n")
+
+    results = {}
+    for label, build in (("iterrows + row_to_document", iterrows_documents),
+                         ("dataframe_to_documents", columnar_documents)):
+        with timer(label, results):
+            count = build(df)
+        print(f"     {count / results[label]:,.0f} docs/s")
+
+    print(f"\n  >> gain {results['iterrows + row_to_document'] / results['dataframe_to_documents']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
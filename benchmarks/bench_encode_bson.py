@@ -0,0 +1,63 @@
+"""
+benchmarks.bench_encode_bson
+
+Compare, par batch de 10 000 lignes, le temps passé dans le processus
+principal à produire les documents BSON d'un dataframe :
+ - construction + encodage dans le processus principal (ce que fait
+   insert_many sur des dicts) ;
+ - iter_encoded_batches : construction et encodage dans un pool de
+   `--workers` processus, le processus principal ne reçoit que des
+   RawBSONDocument.
+
+    python -m benchmarks.bench_encode_bson --rows 200000 --workers 4
+
+"""
+import argparse
+import os
+import time
+
+import bson
+
+from benchmarks.utils import timer
+from libs.mongoDb.encode_bson import iter_encoded_batches, iter_row_batches
+from libs.normalisers import normalize_dataframe
+from libs.row_to_json import dataframe_to_documents
+from tests.factories import make_healthcare_df
+
+BATCH_SIZE = 10_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark encodage BSON")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    df = normalize_dataframe(make_healthcare_df(args.rows))
+    print(f"\n* Benchmark encodage BSON : {len(df)} lignes, {args.workers} workers, "
+          f"{os.cpu_count()} CPU *\n")
+
+    results = {}
+    cpu = {}
+    label = "processus principal"
+    start = time.process_time()
+    with timer(label, results):
+        n_bytes = sum(len(bson.encode(doc)) for frame in iter_row_batches([df], BATCH_SIZE)
+                      for doc in dataframe_to_documents(frame))
+    cpu[label] = time.process_time() - start
+
+    label = f"pool de {args.workers} processus"
+    start = time.process_time()
+    with timer(label, results):
+        n_docs = sum(len(docs) for docs in iter_encoded_batches(iter_row_batches([df], BATCH_SIZE), args.workers))
+    cpu[label] = time.process_time() - start
+
+    # Temps CPU du processus principal : temps disponible pour les insertions
+    for label, seconds in results.items():
+        print(f"  >> {label} : {len(df) / seconds:,.0f} docs/s, "
+              f"CPU du processus principal {cpu[label]:.2f} s")
+    print(f"\n  >> {n_docs} documents, {n_bytes / 1e6:.1f} Mo de BSON")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+benchmarks.bench_fingerprints
+
+Compare la recherche d'empreintes dans le magasin (répertoire des préfixes,
+temps constant par empreinte) à une recherche dichotomique (np.searchsorted)
+dans le même fichier trié en mémoire mappée.
+
+    python -m benchmarks.bench_fingerprints --stored 10000000 --queries 1000000
+
+"""
+import argparse
+import tempfile
+
+import numpy as np
+
+from benchmarks.utils import timer
+from libs.fingerprints import FingerprintStore
+
+
+def searchsorted_contains(values: np.ndarray, fingerprints: np.ndarray) -> np.ndarray:
+    """ Recherche dichotomique dans le fichier trié. """
+    position = np.searchsorted(values, fingerprints)
+    found = position < len(values)
+    found[found] = values[position[found]] == fingerprints[found]
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark magasin d'empreintes")
+    parser.add_argument("--stored", type=int, default=10_000_000)
+    parser.add_argument("--queries", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    stored = rng.integers(0, 2**64, args.stored, dtype=np.uint64)
+    # Moitié d'empreintes connues, moitié nouvelles
+    queries = np.concatenate([
+        rng.choice(stored, args.queries // 2),
+        rng.integers(0, 2**64, args.queries - args.queries // 2, dtype=np.uint64),
+    ])
+    print(f"\n* Benchmark empreintes : {args.queries} recherches dans {args.stored} empreintes *\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = FingerprintStore("bench", directory)
+        results = {}
+        with timer("écriture du magasin", results):
+            store.replace(stored)
+        with timer("searchsorted (mmap)", results):
+            expected = searchsorted_contains(store._values(), queries)
+        with timer("répertoire des préfixes", results):
+            found = store.contains(queries)
+
+    print(f"\n  >> gain {results['searchsorted (mmap)'] / results['répertoire des préfixes']:.1f}x, "
+          f"identique : {np.array_equal(found, expected)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+benchmarks.bench_id_strategy
+
+Compare les stratégies de génération des _id (ID_STRATEGIES) :
+ - génération : _id par seconde et taille BSON d'un _id ;
+ - avec --mongo-uri : débit d'insertion (documents / s) et taille de
+   l'index _id (collStats) dans une collection temporaire par stratégie.
+
+    python -m benchmarks.bench_id_strategy --rows 200000
+    python -m benchmarks.bench_id_strategy --rows 1000000 --mongo-uri mongodb://localhost:27017
+
+"""
+import argparse
+
+import bson
+
+from pymongo import MongoClient
+
+from benchmarks.utils import timer
+from libs.mongoDb.encode_bson import iter_row_batches
+from libs.normalisers import normalize_dataframe
+from libs.row_to_json import dataframe_to_documents, document_ids
+from tests.factories import make_healthcare_df
+
+from settings.constants import ID_STRATEGIES
+
+BATCH_SIZE = 10_000
+BENCH_DB = "bench_id_strategy"
+
+
+def id_size(value) -> int:
+    """ Taille BSON de l'élément _id. """
+    return len(bson.encode({"_id": value})) - len(bson.encode({}))
+
+
+def insert_all(df, collection, strategy: str) -> None:
+    for frame in iter_row_batches([df], BATCH_SIZE):
+        collection.insert_many(dataframe_to_documents(frame, strategy), ordered=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark stratégies de _id")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--mongo-uri", help="Mesure aussi l'insertion et la taille de l'index _id")
+    args = parser.parse_args()
+
+    df = normalize_dataframe(make_healthcare_df(args.rows))
+    print(f"\n* Benchmark _id : {len(df)} lignes *\n")
+
+    results = {}
+    for strategy in ID_STRATEGIES:
+        with timer(f"génération {strategy}", results):
+            ids = document_ids(df, strategy)
+        print(f"     {len(df) / results[f'génération {strategy}']:,.0f} _id/s, {id_size(ids[0])} octets BSON")
+
+    if not args.mongo_uri:
+        return
+
+    client = MongoClient(args.mongo_uri)
+    db = client[BENCH_DB]
+    print()
+    for strategy in ID_STRATEGIES:
+        db.drop_collection(strategy)
+        label = f"insertion {strategy}"
+        with timer(label, results):
+            insert_all(df, db[strategy], strategy)
+        index_size = db.command("collStats", strategy)["indexSizes"]["_id_"]
+        print(f"     {len(df) / results[label]:,.0f} docs/s, index _id {index_size / 1e6:.1f} Mo")
+    client.drop_database(BENCH_DB)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+benchmarks.bench_inconsistent
+
+Compare find_inconsistent_columns (empreintes 64 bits, une passe de table
+de hachage par colonne) à l'implémentation d'origine (un groupby sur
+toutes les autres colonnes, par colonne), sur le dataframe normalisé et
+sans doublons stricts, comme dans analyse_df.
+
+    python -m benchmarks.bench_inconsistent --rows 1000000
+
+"""
+import argparse
+import warnings
+
+import pandas as pd
+
+from benchmarks.utils import healthcare_csv, timer
+from libs.checks import find_inconsistent_columns
+from libs.normalisers import normalize_dataframe
+from libs.utils import read_csv_typed
+
+
+def groupby_inconsistent_columns(df: pd.DataFrame) -> list[str]:
+    """ Implémentation d'origine. """
+    cols = df.columns.tolist()
+    inconsistent_cols = []
+    for col in cols:
+        other_cols = [c for c in cols if c != col]
+        if df.groupby(other_cols)[col].nunique().gt(1).any():
+            inconsistent_cols.append(col)
+    return inconsistent_cols
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark recherche des colonnes incohérentes")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = normalize_dataframe(read_csv_typed(healthcare_csv(args.rows)))
+    df = df.drop_duplicates().reset_index(drop=True)
+    print(f"\n* Benchmark colonnes incohérentes : {len(df)} lignes, {len(df.columns)} colonnes *\n")
+
+    results = {}
+    with timer("groupby par colonne", results), warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)  # observed=False
+        expected = groupby_inconsistent_columns(df)
+    with timer("empreintes 64 bits", results):
+        found = find_inconsistent_columns(df)
+
+    print(f"\n  >> gain {results['groupby par colonne'] / results['empreintes 64 bits']:.1f}x, "
+          f"identique : {found == expected} {found}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+benchmarks.bench_incremental
+
+Durée d'un rechargement complet (collection vidée, _id "hash") et d'un
+import incrémental (libs.mongoDb.incremental) du même nouvel extrait, pour
+1 % et 10 % de lignes changées : un tiers modifiées, un tiers supprimées,
+un tiers ajoutées.
+
+Sans --mongo-uri, la collection est simulée : une requête (insert_many ou
+bulk_write) dure `--overhead` secondes plus l'écriture des octets BSON des
+documents à `--bandwidth` Mo/s, plus `--delete-us` microsecondes par
+suppression. Sans consommer de CPU.
+
+    python -m benchmarks.bench_incremental --rows 200000
+    python -m benchmarks.bench_incremental --rows 1000000 --mongo-uri mongodb://localhost:27017
+
+"""
+import argparse
+import contextlib
+import io
+import time
+
+import pandas as pd
+
+from pymongo import DeleteOne, InsertOne, MongoClient, UpdateOne
+
+from benchmarks.utils import timer
+from libs.mongoDb.batching import documents_bytes
+from libs.mongoDb.incremental import migrate_incremental
+from libs.mongoDb.migrate_to_mongodb import migrate_dataframe_to_collection
+from libs.normalisers import normalize_dataframe
+from libs.snapshots import snapshot_of
+from tests.factories import make_healthcare_df
+
+BATCH_SIZE = 10_000
+BENCH_DB = "bench_incremental"
+
+
+class CostModelCollection:
+    """ Collection simulée : durée des requêtes selon les octets écrits et les suppressions. """
+
+    def __init__(self, overhead: float, bandwidth: float, delete_seconds: float, count: int = 0):
+        self.overhead = overhead
+        self.bandwidth = bandwidth
+        self.delete_seconds = delete_seconds
+        self.count = count
+
+    def insert_many(self, docs, ordered=True):
+        time.sleep(self.overhead + documents_bytes(docs) / self.bandwidth)
+        self.count += len(docs)
+
+        class Result:
+            inserted_ids = [doc["_id"] for doc in docs]
+        return Result()
+
+    def bulk_write(self, operations, ordered=True):
+        inserts = [op._doc for op in operations if isinstance(op, InsertOne)]
+        updates = [op._doc["$set"] for op in operations if isinstance(op, UpdateOne)]
+        deletes = sum(isinstance(op, DeleteOne) for op in operations)
+        time.sleep(self.overhead + documents_bytes(inserts + updates) / self.bandwidth
+                   + deletes * self.delete_seconds)
+        self.count += len(inserts) - deletes
+
+        class Result:
+            inserted_count = len(inserts)
+            matched_count = len(updates)
+            deleted_count = deletes
+        return Result()
+
+    def count_documents(self, query):
+        return self.count
+
+
+def churned(df: pd.DataFrame, ratio: float, seed: int) -> pd.DataFrame:
+    """ Nouvel extrait : `ratio` des lignes changées (modifiées, supprimées, ajoutées). """
+    n = int(len(df) * ratio / 3)
+    new = df.iloc[n:].copy()
+    new.loc[new.index[:n], "Billing Amount"] += 1.0
+    added = normalize_dataframe(make_healthcare_df(n, seed=seed, dup_ratio=0, inconsistent_ratio=0))
+    return pd.concat([new, added], ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark import incrémental")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--overhead", type=float, default=0.03)
+    parser.add_argument("--bandwidth", type=float, default=100, help="Mo/s")
+    parser.add_argument("--delete-us", type=float, default=20)
+    parser.add_argument("--mongo-uri")
+    args = parser.parse_args()
+
+    df = normalize_dataframe(make_healthcare_df(args.rows, dup_ratio=0, inconsistent_ratio=0))
+    target = args.mongo_uri or (f"collection simulée ({args.overhead * 1000:.0f} ms + {args.bandwidth:.0f} Mo/s, "
+                                f"{args.delete_us:.0f} µs par suppression)")
+    print(f"\n* Benchmark import incrémental : {len(df)} lignes, {target} *\n")
+
+    client = MongoClient(args.mongo_uri) if args.mongo_uri else None
+
+    def collection(loaded: bool):
+        """ Collection vide, ou contenant l'import précédent (`df`). """
+        if client is None:
+            return CostModelCollection(args.overhead, args.bandwidth * 1e6, args.delete_us / 1e6,
+                                       len(df) if loaded else 0)
+        client[BENCH_DB].drop_collection("hospitalizations")
+        target = client[BENCH_DB]["hospitalizations"]
+        if loaded:
+            with contextlib.redirect_stdout(io.StringIO()):
+                migrate_dataframe_to_collection(df, target, batch_size=BATCH_SIZE, id_strategy="hash")
+        return target
+
+    old = snapshot_of(df)
+    results = {}
+    for ratio in (0.01, 0.10):
+        new = churned(df, ratio, seed=1 + len(results))
+        runs = [
+            (f"{ratio:.0%} changées, rechargement complet", False, lambda target: migrate_dataframe_to_collection(
+                new, target, batch_size=BATCH_SIZE, id_strategy="hash")),
+            (f"{ratio:.0%} changées, incrémental", True, lambda target: migrate_incremental(
+                [new], target, old, batch_size=BATCH_SIZE)[0]),
+        ]
+        for label, loaded, run in runs:
+            # Le chargement de l'import précédent n'est pas mesuré
+            target = collection(loaded)
+            with timer(label, results), contextlib.redirect_stdout(io.StringIO()):
+                stats = run(target)
+            print(f"     erreur : {stats['had_error']}")
+    if client is not None:
+        client.drop_database(BENCH_DB)
+
+
+if __name__ == "__main__":
+    main()
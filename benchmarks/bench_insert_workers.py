@@ -0,0 +1,82 @@
+"""
+benchmarks.bench_insert_workers
+
+Débit de migrate_dataframe_to_collection (documents / s) selon le nombre
+d'insertions simultanées (--insert-workers).
+
+Sans --mongo-uri, la collection est simulée : chaque insert_many dure
+`--latency` secondes (aller-retour réseau et écriture côté serveur),
+sans consommer de CPU.
+
+    python -m benchmarks.bench_insert_workers --rows 200000 --latency 0.05
+    python -m benchmarks.bench_insert_workers --rows 1000000 --mongo-uri mongodb://localhost:27017
+
+"""
+import argparse
+import contextlib
+import io
+import threading
+import time
+
+from pymongo import MongoClient
+
+from benchmarks.utils import timer
+from libs.mongoDb.migrate_to_mongodb import migrate_dataframe_to_collection
+from libs.normalisers import normalize_dataframe
+from tests.factories import make_healthcare_df
+
+BATCH_SIZE = 10_000
+BENCH_DB = "bench_insert_workers"
+
+
+class LatencyCollection:
+    """ Collection simulée : insert_many attend `latency` secondes. """
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def insert_many(self, docs, ordered=True):
+        time.sleep(self.latency)
+        with self.lock:
+            self.count += len(docs)
+
+        class Result:
+            inserted_ids = [doc["_id"] for doc in docs]
+        return Result()
+
+    def count_documents(self, query):
+        return self.count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark insertions concurrentes")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--mongo-uri")
+    args = parser.parse_args()
+
+    df = normalize_dataframe(make_healthcare_df(args.rows))
+    target = args.mongo_uri or f"collection simulée, {args.latency * 1000:.0f} ms par insert_many"
+    print(f"\n* Benchmark insertions : {len(df)} lignes, batchs de {BATCH_SIZE}, {target} *\n")
+
+    client = MongoClient(args.mongo_uri) if args.mongo_uri else None
+    results = {}
+    for workers in (1, 2, 4, 8):
+        if client is not None:
+            client[BENCH_DB].drop_collection("hospitalizations")
+            collection = client[BENCH_DB]["hospitalizations"]
+        else:
+            collection = LatencyCollection(args.latency)
+        label = f"{workers} insertion(s) simultanée(s)"
+        with timer(label, results), contextlib.redirect_stdout(io.StringIO()):
+            stats = migrate_dataframe_to_collection(df, collection, batch_size=BATCH_SIZE,
+                                                    insert_workers=workers)
+        print(f"     {len(df) / results[label]:,.0f} docs/s, erreur : {stats['had_error']}")
+    if client is not None:
+        client.drop_database(BENCH_DB)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+benchmarks.bench_load_csv
+
+Compare le chargement du CSV : pd.read_csv sans types (ancien load_csv)
+et lecture typée (read_csv_typed, pyarrow si disponible).
+
+    python -m benchmarks.bench_load_csv --rows 1000000
+
+"""
+import argparse
+
+from benchmarks.utils import healthcare_csv, timer, megabytes
+from libs.normalisers import normalize_dataframe
+from libs.utils import read_csv_typed, csv_engine
+
+import pandas as pd
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chargement CSV")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    csv_path = healthcare_csv(args.rows)
+    print(f"\n* Benchmark chargement CSV : {csv_path} (moteur typé : {csv_engine()}) *\n")
+
+    times = {}
+    with timer("read_csv sans types", times):
+        df_plain = pd.read_csv(csv_path)
+    with timer("read_csv_typed", times):
+        df_typed = read_csv_typed(csv_path)
+
+    print(f"\n  >> Mémoire sans types : {megabytes(df_plain):8.1f} Mo")
+    print(f"  >> Mémoire typée      : {megabytes(df_typed):8.1f} Mo")
+    print(f"  >> Gain lecture       : x{times['read_csv sans types'] / times['read_csv_typed']:.2f}\n")
+
+    with timer("normalize_dataframe (sans types)", times):
+        df_plain = normalize_dataframe(df_plain)
+    with timer("normalize_dataframe (typé)", times):
+        df_typed = normalize_dataframe(df_typed)
+
+    identical = df_plain.equals(df_typed)
+    print(f"\n  >> Résultat normalisé identique : {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+benchmarks.bench_normalise
+
+Compare, colonne par colonne, la normalisation par Series.apply des
+fonctions scalaires de référence, normalize_dataframe vectorisé sans
+mémoïsation, et normalize_dataframe mémoïsé (une fois par valeur distincte).
+
+    python -m benchmarks.bench_normalise --rows 1000000
+
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.utils import healthcare_csv
+from libs.normalisers import (
+    normalize_dataframe,
+    can_memoize,
+    normalize_name,
+    normalize_int,
+    normalize_float,
+    normalize_string,
+)
+from libs.utils import read_csv_typed
+
+from settings.constants import INT_COLS, FLOAT_COLS, DATE_COLS, NORMALIZE_UNIQUE_RATIO
+
+
+def reference_column(serie: pd.Series) -> pd.Series:
+    """ Normalisation d'une colonne par les fonctions scalaires (ancien normalize_dataframe). """
+    if serie.name in DATE_COLS:
+        return pd.to_datetime(serie, errors="coerce")
+    if serie.name in INT_COLS:
+        return serie.astype(object).apply(normalize_int)
+    if serie.name in FLOAT_COLS:
+        return serie.apply(normalize_float)
+    if serie.name == "Name":
+        serie = serie.apply(normalize_name)
+    return serie.astype(object).apply(normalize_string)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark normalisation")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = read_csv_typed(healthcare_csv(args.rows))
+    print(f"\n* Benchmark normalisation : {len(df)} lignes *\n")
+    print(f"  {'colonne': <20} {'apply s': >8} {'vect. s': >8} {'mémo s': >8} "
+          f"{'gain vect.': >10} {'gain mémo': >10}  mémo  identique")
+
+    totals = [0.0, 0.0, 0.0]
+    for col in df.columns:
+        start = time.perf_counter()
+        expected = reference_column(df[col].copy())
+        t_ref = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vectorised = normalize_dataframe(df[[col]].copy(), max_unique_ratio=0)[col]
+        t_vec = time.perf_counter() - start
+
+        start = time.perf_counter()
+        memoized = normalize_dataframe(df[[col]].copy())[col]
+        t_memo = time.perf_counter() - start
+
+        for i, t in enumerate((t_ref, t_vec, t_memo)):
+            totals[i] += t
+        identical = all(r.equals(expected) and r.dtype == expected.dtype for r in (vectorised, memoized))
+        memo = can_memoize(df[col]) and df[col].nunique() <= NORMALIZE_UNIQUE_RATIO * len(df)
+        print(f"  {col: <20} {t_ref: >8.3f} {t_vec: >8.3f} {t_memo: >8.3f} "
+              f"{t_ref / t_vec: >9.1f}x {t_ref / t_memo: >9.1f}x  {'oui' if memo else 'non': <4}  {identical}")
+
+    t_ref, t_vec, t_memo = totals
+    print(f"\n  {'TOTAL': <20} {t_ref: >8.3f} {t_vec: >8.3f} {t_memo: >8.3f} "
+          f"{t_ref / t_vec: >9.1f}x {t_ref / t_memo: >9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
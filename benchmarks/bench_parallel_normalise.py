@@ -0,0 +1,46 @@
+"""
+benchmarks.bench_parallel_normalise
+
+Courbe de montée en charge de normalize_dataframe_parallel selon le
+nombre de processus (1 = normalize_dataframe en série).
+
+    python -m benchmarks.bench_parallel_normalise --rows 1000000 --workers 1 2 4 8 16
+
+"""
+import argparse
+import os
+import time
+
+from benchmarks.utils import healthcare_csv
+from libs.normalisers import normalize_dataframe
+from libs.parallel import normalize_dataframe_parallel
+from libs.utils import read_csv_typed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark normalisation multi-processus")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    df = read_csv_typed(healthcare_csv(args.rows))
+    print(f"\n* Benchmark normalisation multi-processus : {len(df)} lignes, {os.cpu_count()} CPU *\n")
+    print(f"  {'workers': >7} {'durée s': >9} {'accélération': >13}  identique")
+
+    expected = None
+    baseline = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        if workers <= 1:
+            result = normalize_dataframe(df.copy())
+        else:
+            result = normalize_dataframe_parallel(df.copy(), workers)
+        elapsed = time.perf_counter() - start
+
+        if expected is None:
+            expected, baseline = result, elapsed
+        print(f"  {workers: >7} {elapsed: >9.3f} {baseline / elapsed: >12.2f}x  {result.equals(expected)}")
+
+
+if __name__ == "__main__":
+    main()
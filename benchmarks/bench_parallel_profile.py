@@ -0,0 +1,52 @@
+"""
+benchmarks.bench_parallel_profile
+
+Courbe de montée en charge de profile_dataframe_parallel (statistiques
+par partition puis fusion) selon le nombre de processus
+(1 = profile_dataframe en série), sur le dataframe normalisé.
+
+    python -m benchmarks.bench_parallel_profile --rows 1000000 --workers 1 2 4 8 16
+
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from benchmarks.utils import healthcare_csv
+from libs.normalisers import normalize_dataframe
+from libs.parallel import profile_dataframe_parallel
+from libs.profiling import profile_dataframe
+from libs.utils import read_csv_typed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark profil multi-processus")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    df = normalize_dataframe(read_csv_typed(healthcare_csv(args.rows)))
+    print(f"\n* Benchmark profil multi-processus : {len(df)} lignes, {os.cpu_count()} CPU *\n")
+    print(f"  {'workers': >7} {'durée s': >9} {'accélération': >13}  identique")
+
+    expected = None
+    baseline = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        if workers <= 1:
+            result = profile_dataframe(df)
+        else:
+            result = profile_dataframe_parallel(df, workers)
+        elapsed = time.perf_counter() - start
+
+        if expected is None:
+            expected, baseline = result, elapsed
+        identical = (result.to_dict() == expected.to_dict()
+                     and np.array_equal(result.duplicated, expected.duplicated))
+        print(f"  {workers: >7} {elapsed: >9.3f} {baseline / elapsed: >12.2f}x  {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+benchmarks.bench_procs
+
+Débit de l'import (documents / s) selon le nombre de processus (--procs),
+chacun avec son propre client.
+
+Sans --mongo-uri, la collection est simulée : chaque insert_many dure
+`--latency` secondes, sans consommer de CPU, et le nombre de documents
+insérés par chaque processus est écrit dans un fichier (compté par le
+bilan final). Le gain attendu vient de la construction des documents,
+répartie sur plusieurs cœurs : il est borné par le nombre de cœurs.
+
+    python -m benchmarks.bench_procs --rows 400000 --latency 0.02
+    python -m benchmarks.bench_procs --rows 1000000 --mongo-uri mongodb://localhost:27017
+
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import time
+
+from functools import partial
+
+from pymongo import MongoClient
+
+from benchmarks.utils import timer
+from libs.mongoDb.migrate_to_mongodb import migrate_parallel, migrate_dataframe_to_collection, mongo_collection
+from libs.normalisers import normalize_dataframe
+from tests.factories import make_healthcare_df
+
+BATCH_SIZE = 10_000
+BENCH_DB = "bench_procs"
+
+
+class CountingCollection:
+    """ Collection simulée, partagée entre processus : insert_many attend `latency` secondes. """
+
+    def __init__(self, directory: str, latency: float):
+        self.directory = directory
+        self.latency = latency
+
+    def insert_many(self, docs, ordered=True):
+        time.sleep(self.latency)
+        with open(os.path.join(self.directory, f"{os.getpid()}.count"), "a") as f:
+            f.write(f"{len(docs)}\n")
+
+        class Result:
+            inserted_ids = [doc["_id"] for doc in docs]
+        return Result()
+
+    def count_documents(self, query):
+        count = 0
+        for name in os.listdir(self.directory):
+            with open(os.path.join(self.directory, name)) as f:
+                count += sum(int(line) for line in f)
+        return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark import multi-processus")
+    parser.add_argument("--rows", type=int, default=400_000)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--mongo-uri")
+    args = parser.parse_args()
+
+    df = normalize_dataframe(make_healthcare_df(args.rows))
+    target = args.mongo_uri or f"collection simulée, {args.latency * 1000:.0f} ms par insert_many"
+    print(f"\n* Benchmark import : {len(df)} lignes, batchs de {BATCH_SIZE}, {target}, "
+          f"{os.cpu_count()} cœur(s) *\n")
+
+    client = MongoClient(args.mongo_uri) if args.mongo_uri else None
+    results = {}
+    for procs in (1, 2, 4):
+        directory = tempfile.mkdtemp(prefix="bench_procs_")
+        if client is not None:
+            client[BENCH_DB].drop_collection("hospitalizations")
+            factory = partial(mongo_collection, args.mongo_uri, BENCH_DB, "hospitalizations")
+        else:
+            factory = partial(CountingCollection, directory, args.latency)
+        label = f"{procs} processus"
+        with timer(label, results), contextlib.redirect_stdout(io.StringIO()):
+            if procs == 1:
+                stats = migrate_dataframe_to_collection(df, factory(), batch_size=BATCH_SIZE)
+            else:
+                stats = migrate_parallel(df, factory, procs, batch_size=BATCH_SIZE)
+        print(f"     {len(df) / results[label]:,.0f} docs/s, erreur : {stats['had_error']}")
+        shutil.rmtree(directory)
+    if client is not None:
+        client.drop_database(BENCH_DB)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+benchmarks.bench_type_check
+
+Compare, colonne par colonne du dataframe normalisé, le comptage des
+types du profil (libs.profiling, TYPE_CHECK_SAMPLE_SIZE) :
+type de chaque valeur (serie.dropna().map(type).value_counts(),
+implémentation d'origine) ou column_type_counts (dtype / infer_dtype),
+complet et échantillonné.
+
+    python -m benchmarks.bench_type_check --rows 1000000 --sample 100000
+
+"""
+import argparse
+import time
+
+from benchmarks.utils import healthcare_csv
+from libs.checks import column_type_counts
+from libs.normalisers import normalize_dataframe
+from libs.utils import read_csv_typed
+
+
+def reference_type_counts(serie) -> dict[str, int]:
+    """ Implémentation d'origine. """
+    serie.isna().sum()
+    counts = serie.dropna().map(type).value_counts()
+    return {t.__name__: int(count) for t, count in counts.items()}
+
+
+def fast_type_counts(serie, sample_size=None) -> dict[str, int]:
+    """ Comme partial_profile : valeurs nulles comptées une fois. """
+    return column_type_counts(serie, sample_size, serie.isna().sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vérification des types")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--sample", type=int, default=100_000)
+    args = parser.parse_args()
+
+    df = normalize_dataframe(read_csv_typed(healthcare_csv(args.rows)))
+    print(f"\n* Benchmark vérification des types : {len(df)} lignes *\n")
+    print(f"  {'colonne': <20} {'dtype': <15} {'map s': >7} {'rapide s': >8} {'échant. s': >9}  identique")
+
+    totals = [0.0, 0.0, 0.0]
+    for col in df.columns:
+        timings = []
+        results = []
+        for func in (reference_type_counts, fast_type_counts,
+                     lambda s: fast_type_counts(s, sample_size=args.sample)):
+            start = time.perf_counter()
+            results.append(func(df[col]))
+            timings.append(time.perf_counter() - start)
+        for i, t in enumerate(timings):
+            totals[i] += t
+        identical = results[0] == results[1] == results[2]
+        print(f"  {col: <20} {str(df[col].dtype): <15} {timings[0]: >7.3f} {timings[1]: >8.3f} "
+              f"{timings[2]: >9.3f}  {identical}")
+
+    print(f"\n  {'TOTAL': <36} {totals[0]: >7.3f} {totals[1]: >8.3f} {totals[2]: >9.3f}"
+          f"   gain {totals[0] / totals[1]:.0f}x / {totals[0] / totals[2]:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
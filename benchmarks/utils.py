@@ -0,0 +1,41 @@
+"""
+benchmarks.utils
+
+CSV synthétiques au format du dataset Kaggle 'healthcare' (voir
+tests.factories), et mesure des temps d'exécution.
+
+"""
+import os
+import time
+import pandas as pd
+
+from contextlib import contextmanager
+
+from tests.factories import make_healthcare_df
+
+BENCH_DIR = "./data_source/bench"
+
+
+def healthcare_csv(n_rows: int, seed: int = 0) -> str:
+    """ Chemin d'un CSV synthétique de `n_rows` lignes, généré s'il n'existe pas encore. """
+    os.makedirs(BENCH_DIR, exist_ok=True)
+    path = os.path.join(BENCH_DIR, f"healthcare_{n_rows}_{seed}.csv")
+    if not os.path.exists(path):
+        make_healthcare_df(n_rows, seed).to_csv(path, index=False)
+    return path
+
+
+@contextmanager
+def timer(label: str, results: dict | None = None):
+    """ Affiche (et mémorise dans `results`) la durée du bloc. """
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    if results is not None:
+        results[label] = elapsed
+    print(f"  >> {label: <40} {elapsed:8.3f} s")
+
+
+def megabytes(df: pd.DataFrame) -> float:
+    """ Empreinte mémoire du dataframe, en Mo. """
+    return df.memory_usage(deep=True).sum() / 1_000_000